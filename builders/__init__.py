@@ -0,0 +1,25 @@
+"""Manifest builders for the DjangoApp operator."""
+
+from importlib import import_module
+
+# Builders resolve lazily (PEP 562), so importing the package is free and a
+# caller touching only one builder pays the import cost of that module alone.
+_EXPORTS = {
+    "DeploymentBuilder": "builders.deployment",
+    "HPABuilder": "builders.hpa",
+    "IngressBuilder": "builders.ingress",
+    "ServiceBuilder": "builders.service",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    attr = getattr(import_module(module_name), name)
+    globals()[name] = attr
+    return attr
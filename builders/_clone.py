@@ -0,0 +1,23 @@
+"""Cheap structural cloning for manifest templates and bodies.
+
+``copy.deepcopy`` pays for memo bookkeeping and per-type dispatch the
+manifests never need; a hand-written walk over mappings and lists is
+several times faster and shares immutable leaves (strings, numbers) by
+reference.
+
+Mappings are always materialized as plain dicts. Built bodies embed the
+shared read-only label views, and those must not leak past a clone: the
+kubernetes client's ``sanitize_for_serialization`` treats any non-dict
+mapping as an OpenAPI model and crashes on ``MappingProxyType``.
+"""
+
+from collections.abc import Mapping
+
+
+def clone(node):
+    """Return a structural copy of *node* made of plain dicts and lists."""
+    if isinstance(node, Mapping):
+        return {key: clone(value) for key, value in node.items()}
+    if isinstance(node, (list, tuple)):
+        return [clone(value) for value in node]
+    return node
@@ -0,0 +1,56 @@
+"""Schema compilation shared by the manifest builders.
+
+Each builder module declares its input schema once and compiles it at import
+time, so every instantiation reuses the same validator instead of re-running
+hand-rolled ``isinstance`` chains.  fastjsonschema generates specialized
+Python code per schema; when it is not installed we fall back to a cached
+:class:`jsonschema.Draft7Validator`.  Both raise :class:`ValueError`
+subclasses on invalid input.
+"""
+
+from collections.abc import Mapping
+
+try:
+    import fastjsonschema
+
+    def compile_schema(schema):
+        """Compile *schema* into a reusable validator callable."""
+        return fastjsonschema.compile(schema)
+
+except ImportError:  # pragma: no cover - exercised only without fastjsonschema
+    import jsonschema
+
+    def compile_schema(schema):
+        """Compile *schema* into a reusable validator callable."""
+        validator = jsonschema.Draft7Validator(schema)
+
+        def validate(instance):
+            # jsonschema's ValidationError is not a ValueError subclass,
+            # unlike fastjsonschema's; re-raise so both backends honor the
+            # ValueError contract promised above.
+            try:
+                validator.validate(instance)
+            except jsonschema.exceptions.ValidationError as error:
+                raise ValueError(str(error)) from None
+            return instance
+
+        return validate
+
+
+def as_dict(value):
+    """Return *value* as a plain dict, or unchanged when not a mapping.
+
+    The builders' slow validation paths use this instead of ``dict(value)``
+    so a wrongly-typed value reaches the schema run as-is and gets its
+    documented ValueError, rather than a TypeError from an eager
+    conversion.
+    """
+    return dict(value) if isinstance(value, Mapping) else value
+
+
+def as_list(value):
+    """Return *value* as a plain list of :func:`as_dict` items, or
+    unchanged when not a list or tuple."""
+    if isinstance(value, (list, tuple)):
+        return [as_dict(item) for item in value]
+    return value
@@ -0,0 +1,141 @@
+"""Builds the Deployment manifest for a DjangoApp."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from builders._clone import clone
+from builders._schema import as_dict, as_list, compile_schema
+from builders.validation import validate_port, validate_replica_bounds
+
+_DEPLOYMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "namespace": {"type": "string", "minLength": 1},
+        "image": {"type": "string", "minLength": 1},
+        "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+        "resources": {"type": "object"},
+        "labels": {"type": "object"},
+        "pod_labels": {"type": "object"},
+        "min_replicas": {"type": "integer", "minimum": 1},
+        "env": {"type": "array", "items": {"type": "object"}},
+    },
+    "required": [
+        "name",
+        "namespace",
+        "image",
+        "port",
+        "resources",
+        "labels",
+        "pod_labels",
+        "min_replicas",
+        "env",
+    ],
+}
+
+_VALIDATE = compile_schema(_DEPLOYMENT_SCHEMA)
+
+# Static skeleton of the manifest; build() clones it and fills in the
+# per-app fields instead of allocating the nested literals on every call.
+_DEPLOYMENT_TEMPLATE = {
+    "apiVersion": "apps/v1",
+    "kind": "Deployment",
+    "metadata": {},
+    "spec": {
+        "selector": {},
+        "template": {
+            "metadata": {},
+            "spec": {
+                "containers": [
+                    {
+                        "name": "django",
+                        "ports": [
+                            {"name": "http", "protocol": "TCP"},
+                        ],
+                    },
+                ],
+            },
+        },
+    },
+}
+
+
+class DeploymentBuilder:
+    """Builds a Deployment running the Django container."""
+
+    __slots__ = ("name", "namespace", "image", "port", "resources",
+                 "labels", "pod_labels", "min_replicas", "env",
+                 "_resource_name")
+
+    def __init__(self, name, namespace, image, port, resources, labels,
+                 pod_labels, min_replicas=1, env=None, validate=True):
+        self.name = name
+        self.namespace = namespace
+        self.image = image
+        self.port = port
+        self.resources = resources
+        self.labels = labels
+        self.pod_labels = pod_labels
+        self.min_replicas = min_replicas
+        self.env = env if env is not None else []
+        self._resource_name = f"{name}-deployment"
+        # The CRD's OpenAPI schema enforces the same invariants at
+        # admission time; pass validate=False for already-trusted input,
+        # or run with python -O to strip the check everywhere.
+        if validate and __debug__:
+            self._validate()
+
+    def _validate(self):
+        # Fast path: one short-circuiting expression covering every check.
+        # Only invalid input falls through to the full schema run, which
+        # exists to produce a detailed error message.
+        if (
+            isinstance(self.name, str) and self.name
+            and isinstance(self.namespace, str) and self.namespace
+            and isinstance(self.image, str) and self.image
+            and type(self.port) is int
+            and isinstance(self.resources, Mapping)
+            and isinstance(self.labels, Mapping)
+            and isinstance(self.pod_labels, Mapping)
+            and type(self.min_replicas) is int
+            and isinstance(self.env, (list, tuple))
+            and all(isinstance(item, Mapping) for item in self.env)
+        ):
+            validate_port(self.port)
+            validate_replica_bounds(self.min_replicas)
+            return
+        _VALIDATE({
+            "name": self.name,
+            "namespace": self.namespace,
+            "image": self.image,
+            "port": self.port,
+            "resources": as_dict(self.resources),
+            "labels": as_dict(self.labels),
+            "pod_labels": as_dict(self.pod_labels),
+            "min_replicas": self.min_replicas,
+            "env": as_list(self.env),
+        })
+
+    def build(self):
+        """Return the Deployment manifest as a dict."""
+        body = clone(_DEPLOYMENT_TEMPLATE)
+        metadata = body["metadata"]
+        metadata["name"] = self._resource_name
+        metadata["namespace"] = self.namespace
+        metadata["labels"] = self.labels
+        spec = body["spec"]
+        spec["replicas"] = self.min_replicas
+        spec["selector"]["matchLabels"] = self.pod_labels
+        spec["template"]["metadata"]["labels"] = self.pod_labels
+        container = spec["template"]["spec"]["containers"][0]
+        container["image"] = self.image
+        container["ports"][0]["containerPort"] = self.port
+        container["env"] = list(self.env)
+        # A read-only resources mapping cannot be mutated downstream, so
+        # embed it by reference like the labels; only plain dicts get the
+        # defensive copy.
+        if isinstance(self.resources, MappingProxyType):
+            container["resources"] = self.resources
+        else:
+            container["resources"] = dict(self.resources)
+        return body
@@ -0,0 +1,112 @@
+"""Builds the HorizontalPodAutoscaler manifest for a DjangoApp."""
+
+from collections.abc import Mapping
+
+from builders._clone import clone
+from builders._schema import as_dict, compile_schema
+from builders.validation import validate_cpu_target, validate_replica_bounds
+
+_HPA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "namespace": {"type": "string", "minLength": 1},
+        "min_replicas": {"type": "integer", "minimum": 1},
+        "max_replicas": {"type": "integer", "minimum": 1},
+        "target_cpu": {"type": "integer", "minimum": 1, "maximum": 100},
+        "labels": {"type": "object"},
+    },
+    "required": [
+        "name",
+        "namespace",
+        "min_replicas",
+        "max_replicas",
+        "target_cpu",
+        "labels",
+    ],
+}
+
+_VALIDATE = compile_schema(_HPA_SCHEMA)
+
+# Static skeleton of the manifest; build() clones it and fills in the
+# per-app fields.
+_HPA_TEMPLATE = {
+    "apiVersion": "autoscaling/v2",
+    "kind": "HorizontalPodAutoscaler",
+    "metadata": {},
+    "spec": {
+        "scaleTargetRef": {
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+        },
+        "metrics": [
+            {
+                "type": "Resource",
+                "resource": {
+                    "name": "cpu",
+                    "target": {"type": "Utilization"},
+                },
+            },
+        ],
+    },
+}
+
+
+class HPABuilder:
+    """Builds a HorizontalPodAutoscaler targeting the app's Deployment."""
+
+    __slots__ = ("name", "namespace", "min_replicas", "max_replicas",
+                 "target_cpu", "labels", "_resource_name", "_target_name")
+
+    def __init__(self, name, namespace, min_replicas, max_replicas,
+                 target_cpu, labels, validate=True):
+        self.name = name
+        self.namespace = namespace
+        self.min_replicas = min_replicas
+        self.max_replicas = max_replicas
+        self.target_cpu = target_cpu
+        self.labels = labels
+        self._resource_name = f"{name}-hpa"
+        self._target_name = f"{name}-deployment"
+        # The CRD's OpenAPI schema enforces the same invariants at
+        # admission time; pass validate=False for already-trusted input,
+        # or run with python -O to strip the check everywhere.
+        if validate and __debug__:
+            self._validate()
+
+    def _validate(self):
+        # Fast path first; invalid input falls through to the full schema
+        # run for a detailed error message.
+        if not (
+            isinstance(self.name, str) and self.name
+            and isinstance(self.namespace, str) and self.namespace
+            and type(self.min_replicas) is int
+            and type(self.max_replicas) is int
+            and type(self.target_cpu) is int
+            and isinstance(self.labels, Mapping)
+        ):
+            _VALIDATE({
+                "name": self.name,
+                "namespace": self.namespace,
+                "min_replicas": self.min_replicas,
+                "max_replicas": self.max_replicas,
+                "target_cpu": self.target_cpu,
+                "labels": as_dict(self.labels),
+            })
+        validate_replica_bounds(self.min_replicas, self.max_replicas)
+        validate_cpu_target(self.target_cpu)
+
+    def build(self):
+        """Return the HorizontalPodAutoscaler manifest as a dict."""
+        body = clone(_HPA_TEMPLATE)
+        metadata = body["metadata"]
+        metadata["name"] = self._resource_name
+        metadata["namespace"] = self.namespace
+        metadata["labels"] = self.labels
+        spec = body["spec"]
+        spec["scaleTargetRef"]["name"] = self._target_name
+        spec["minReplicas"] = self.min_replicas
+        spec["maxReplicas"] = self.max_replicas
+        target = spec["metrics"][0]["resource"]["target"]
+        target["averageUtilization"] = self.target_cpu
+        return body
@@ -0,0 +1,230 @@
+"""Structural validation for built manifests.
+
+The full kubernetes-json-schema definitions are not vendored here; these
+schemas cover the structure this operator actually emits. Validators are
+compiled once per kind on first use and kept in _VALIDATORS, so validating
+N manifests costs one compilation per kind rather than N.
+
+Label and selector values are deliberately left untyped: the builders embed
+the shared read-only mapping views there, which are mappings but not dicts.
+"""
+
+import json
+import warnings
+from types import MappingProxyType
+
+try:
+    import msgspec
+except ImportError:
+    _MSGSPEC_ENCODER = None
+else:
+    # One C-level encoder instance reused for every dump; deterministic
+    # ordering sorts map keys, and enc_hook renders the read-only mapping
+    # views as plain dicts.
+    _MSGSPEC_ENCODER = msgspec.json.Encoder(order="deterministic",
+                                            enc_hook=dict)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+else:
+    try:
+        _YAML_DUMPER = yaml.CSafeDumper
+    except AttributeError:
+        warnings.warn(
+            "libyaml is not available; YAML emission falls back to the "
+            "pure-Python SafeDumper", RuntimeWarning)
+        _YAML_DUMPER = yaml.SafeDumper
+    # The builders embed read-only mapping views; represent them like dicts.
+    _YAML_DUMPER.add_representer(
+        MappingProxyType,
+        lambda dumper, data: dumper.represent_dict(data))
+
+from builders._schema import compile_schema
+
+_METADATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "namespace": {"type": "string", "minLength": 1},
+    },
+    "required": ["name", "namespace", "labels"],
+}
+
+_SCHEMAS = {
+    "Deployment": {
+        "type": "object",
+        "properties": {
+            "apiVersion": {"const": "apps/v1"},
+            "kind": {"const": "Deployment"},
+            "metadata": _METADATA_SCHEMA,
+            "spec": {
+                "type": "object",
+                "properties": {
+                    "replicas": {"type": "integer", "minimum": 1},
+                    "selector": {"type": "object"},
+                    "template": {
+                        "type": "object",
+                        "properties": {
+                            "spec": {
+                                "type": "object",
+                                "properties": {
+                                    "containers": {
+                                        "type": "array",
+                                        "minItems": 1,
+                                        "items": {
+                                            "type": "object",
+                                            "properties": {
+                                                "name": {"type": "string"},
+                                                "image": {"type": "string"},
+                                                "ports": {"type": "array"},
+                                            },
+                                            "required": ["name", "image"],
+                                        },
+                                    },
+                                },
+                                "required": ["containers"],
+                            },
+                        },
+                        "required": ["spec"],
+                    },
+                },
+                "required": ["replicas", "selector", "template"],
+            },
+        },
+        "required": ["apiVersion", "kind", "metadata", "spec"],
+    },
+    "HorizontalPodAutoscaler": {
+        "type": "object",
+        "properties": {
+            "apiVersion": {"const": "autoscaling/v2"},
+            "kind": {"const": "HorizontalPodAutoscaler"},
+            "metadata": _METADATA_SCHEMA,
+            "spec": {
+                "type": "object",
+                "properties": {
+                    "scaleTargetRef": {
+                        "type": "object",
+                        "properties": {
+                            "kind": {"const": "Deployment"},
+                            "name": {"type": "string", "minLength": 1},
+                        },
+                        "required": ["kind", "name"],
+                    },
+                    "minReplicas": {"type": "integer", "minimum": 1},
+                    "maxReplicas": {"type": "integer", "minimum": 1},
+                    "metrics": {"type": "array", "minItems": 1},
+                },
+                "required": ["scaleTargetRef", "minReplicas", "maxReplicas"],
+            },
+        },
+        "required": ["apiVersion", "kind", "metadata", "spec"],
+    },
+    "Service": {
+        "type": "object",
+        "properties": {
+            "apiVersion": {"const": "v1"},
+            "kind": {"const": "Service"},
+            "metadata": _METADATA_SCHEMA,
+            "spec": {
+                "type": "object",
+                "properties": {
+                    "ports": {"type": "array", "minItems": 1},
+                },
+                "required": ["selector", "ports"],
+            },
+        },
+        "required": ["apiVersion", "kind", "metadata", "spec"],
+    },
+    "Ingress": {
+        "type": "object",
+        "properties": {
+            "apiVersion": {"const": "networking.k8s.io/v1"},
+            "kind": {"const": "Ingress"},
+            "metadata": _METADATA_SCHEMA,
+            "spec": {
+                "type": "object",
+                "properties": {
+                    "rules": {"type": "array", "minItems": 1},
+                },
+                "required": ["rules"],
+            },
+        },
+        "required": ["apiVersion", "kind", "metadata", "spec"],
+    },
+}
+
+_VALIDATORS = {}
+
+
+def validate_manifest(manifest):
+    """Validate *manifest* against the structural schema for its kind.
+
+    Raises ValueError for an unknown kind or a manifest that does not
+    match; returns the manifest unchanged otherwise.
+    """
+    kind = manifest.get("kind")
+    validator = _VALIDATORS.get(kind)
+    if validator is None:
+        try:
+            schema = _SCHEMAS[kind]
+        except KeyError:
+            raise ValueError(f"no schema for manifest kind {kind!r}") from None
+        validator = _VALIDATORS[kind] = compile_schema(schema)
+    validator(manifest)
+    return manifest
+
+
+def validate_all(manifests):
+    """Validate several manifests in one pass, reporting every failure.
+
+    All manifests go through the shared per-kind validators (which embed
+    one metadata subschema between them), so a whole reconciliation's
+    worth of bodies costs at most one compilation per kind. Failures are
+    collected across the batch and raised as a single ValueError instead
+    of stopping at the first bad manifest.
+    """
+    errors = []
+    for manifest in manifests:
+        try:
+            validate_manifest(manifest)
+        except ValueError as error:
+            errors.append(f"{manifest.get('kind')}: {error}")
+    if errors:
+        raise ValueError("; ".join(errors))
+    return manifests
+
+
+def dump_manifest(manifest):
+    """Serialize *manifest* to deterministic JSON bytes.
+
+    Keys are sorted, so identical manifests always produce identical
+    bytes - suitable for logging and golden-file comparison. msgspec's
+    C encoder is preferred, then orjson, then the stdlib; every path
+    renders the shared read-only label views as plain JSON objects.
+    """
+    if _MSGSPEC_ENCODER is not None:
+        return _MSGSPEC_ENCODER.encode(manifest)
+    if orjson is not None:
+        return orjson.dumps(manifest, default=dict,
+                            option=orjson.OPT_SORT_KEYS)
+    return json.dumps(manifest, sort_keys=True, default=dict,
+                      separators=(",", ":")).encode()
+
+
+def to_yaml(manifest):
+    """Render *manifest* as YAML.
+
+    Uses the libyaml-backed CSafeDumper when available, which keeps the
+    emitter in C instead of PyYAML's per-node Python dispatch.
+    """
+    if yaml is None:
+        raise ImportError("PyYAML is required for to_yaml()")
+    return yaml.dump(manifest, Dumper=_YAML_DUMPER, sort_keys=False,
+                     default_flow_style=False)
@@ -0,0 +1,88 @@
+"""Builds the Service manifest for a DjangoApp."""
+
+from collections.abc import Mapping
+
+from builders._clone import clone
+from builders._schema import as_dict, compile_schema
+from builders.validation import validate_port
+
+_SERVICE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "namespace": {"type": "string", "minLength": 1},
+        "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+        "labels": {"type": "object"},
+        "pod_labels": {"type": "object"},
+    },
+    "required": ["name", "namespace", "port", "labels", "pod_labels"],
+}
+
+_VALIDATE = compile_schema(_SERVICE_SCHEMA)
+
+# Static skeleton of the manifest; build() clones it and fills in the
+# per-app fields.
+_SERVICE_TEMPLATE = {
+    "apiVersion": "v1",
+    "kind": "Service",
+    "metadata": {},
+    "spec": {
+        "type": "ClusterIP",
+        "ports": [
+            {"name": "http", "port": 80, "protocol": "TCP"},
+        ],
+    },
+}
+
+
+class ServiceBuilder:
+    """Builds a ClusterIP Service in front of the app's pods."""
+
+    __slots__ = ("name", "namespace", "port", "labels", "pod_labels",
+                 "_resource_name")
+
+    def __init__(self, name, namespace, port, labels, pod_labels,
+                 validate=True):
+        self.name = name
+        self.namespace = namespace
+        self.port = port
+        self.labels = labels
+        self.pod_labels = pod_labels
+        self._resource_name = f"{name}-service"
+        # The CRD's OpenAPI schema enforces the same invariants at
+        # admission time; pass validate=False for already-trusted input,
+        # or run with python -O to strip the check everywhere.
+        if validate and __debug__:
+            self._validate()
+
+    def _validate(self):
+        # Fast path first; invalid input falls through to the full schema
+        # run for a detailed error message.
+        if (
+            isinstance(self.name, str) and self.name
+            and isinstance(self.namespace, str) and self.namespace
+            and type(self.port) is int
+            and isinstance(self.labels, Mapping)
+            and isinstance(self.pod_labels, Mapping)
+        ):
+            validate_port(self.port)
+            return
+        _VALIDATE({
+            "name": self.name,
+            "namespace": self.namespace,
+            "port": self.port,
+            "labels": as_dict(self.labels),
+            "pod_labels": as_dict(self.pod_labels),
+        })
+
+    def build(self):
+        """Return the Service manifest as a dict."""
+        body = clone(_SERVICE_TEMPLATE)
+        metadata = body["metadata"]
+        metadata["name"] = self._resource_name
+        metadata["namespace"] = self.namespace
+        metadata["labels"] = self.labels
+        spec = body["spec"]
+        spec["selector"] = self.pod_labels
+        spec["ports"][0]["targetPort"] = self.port
+        return body
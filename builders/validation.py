@@ -0,0 +1,76 @@
+"""Memoized scalar validators shared by the manifest builders.
+
+The same port, replica and CPU-target values recur across reconciliations,
+so successful range checks are cached per input value with lru_cache.
+Raised exceptions are not cached, so invalid values keep raising on every
+call.
+
+Type checks run before the cache, not inside it: lru_cache compares keys
+with ``==`` and ``True == 1``, so a cached success for ``1`` would
+otherwise be served for ``True`` as well. Only genuine ints reach the
+cached range checks.
+"""
+
+from functools import lru_cache
+
+
+def validate_port(port):
+    """Raise ValueError unless *port* is a valid TCP port number."""
+    if type(port) is not int:
+        raise ValueError(
+            f"port must be an integer between 1 and 65535, got {port!r}")
+    _check_port_range(port)
+
+
+@lru_cache(maxsize=1024)
+def _check_port_range(port):
+    if not 1 <= port <= 65535:
+        raise ValueError(
+            f"port must be an integer between 1 and 65535, got {port!r}")
+
+
+def validate_replica_bounds(min_replicas, max_replicas=None):
+    """Raise ValueError unless the replica bounds are sane.
+
+    With only *min_replicas* given, checks that it is a positive integer;
+    with both, additionally checks that the minimum does not exceed the
+    maximum.
+    """
+    if type(min_replicas) is not int:
+        raise ValueError(
+            f"min_replicas must be a positive integer, got {min_replicas!r}")
+    if max_replicas is not None and type(max_replicas) is not int:
+        raise ValueError(
+            f"max_replicas must be a positive integer, got {max_replicas!r}")
+    _check_replica_bounds(min_replicas, max_replicas)
+
+
+@lru_cache(maxsize=1024)
+def _check_replica_bounds(min_replicas, max_replicas):
+    if min_replicas < 1:
+        raise ValueError(
+            f"min_replicas must be a positive integer, got {min_replicas!r}")
+    if max_replicas is None:
+        return
+    if max_replicas < 1:
+        raise ValueError(
+            f"max_replicas must be a positive integer, got {max_replicas!r}")
+    if min_replicas > max_replicas:
+        raise ValueError(
+            f"min_replicas ({min_replicas}) must not exceed "
+            f"max_replicas ({max_replicas})")
+
+
+def validate_cpu_target(target_cpu):
+    """Raise ValueError unless *target_cpu* is a utilization percentage."""
+    if type(target_cpu) is not int:
+        raise ValueError(
+            f"target_cpu must be an integer between 1 and 100, got {target_cpu!r}")
+    _check_cpu_target_range(target_cpu)
+
+
+@lru_cache(maxsize=1024)
+def _check_cpu_target_range(target_cpu):
+    if not 1 <= target_cpu <= 100:
+        raise ValueError(
+            f"target_cpu must be an integer between 1 and 100, got {target_cpu!r}")
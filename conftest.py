@@ -0,0 +1,56 @@
+"""Shared pytest fixtures for the operator test suite.
+
+Everything here is session-scoped: the literals and label mappings are
+created once per test session and shared by reference, which the builders
+support because they treat immutable inputs as read-only.
+"""
+
+from types import MappingProxyType
+
+import pytest
+
+from helpers import get_common_labels, get_pod_labels
+
+
+@pytest.fixture(scope="session")
+def app_name():
+    return "test-app"
+
+
+@pytest.fixture(scope="session")
+def namespace():
+    return "default"
+
+
+@pytest.fixture(scope="session")
+def image():
+    return "example/test-app:latest"
+
+
+@pytest.fixture(scope="session")
+def port():
+    return 8000
+
+
+@pytest.fixture(scope="session")
+def labels(app_name):
+    return get_common_labels(app_name)
+
+
+@pytest.fixture(scope="session")
+def pod_labels(app_name):
+    return get_pod_labels(app_name)
+
+
+@pytest.fixture(scope="session")
+def resources():
+    return MappingProxyType({
+        "requests": MappingProxyType({"cpu": "100m", "memory": "128Mi"}),
+        "limits": MappingProxyType({"cpu": "500m", "memory": "512Mi"}),
+    })
+
+
+@pytest.fixture(scope="session")
+def env():
+    return (MappingProxyType(
+        {"name": "DJANGO_SETTINGS_MODULE", "value": "config.settings"}),)
@@ -0,0 +1,31 @@
+"""Shared helpers for the DjangoApp operator."""
+
+from functools import lru_cache
+from types import MappingProxyType
+
+
+@lru_cache(maxsize=1024)
+def get_common_labels(app_name):
+    """Return the labels applied to every resource owned by *app_name*.
+
+    Results are cached per app name and returned as read-only views, so
+    repeated reconciliations reuse the same mapping and callers cannot
+    mutate the cached entry.
+    """
+    return MappingProxyType({
+        "app.kubernetes.io/name": app_name,
+        "app.kubernetes.io/part-of": "django",
+        "app.kubernetes.io/managed-by": "django-operator",
+    })
+
+
+@lru_cache(maxsize=1024)
+def get_pod_labels(app_name):
+    """Return the selector labels shared by the Deployment and Service.
+
+    Cached and read-only, like :func:`get_common_labels`.
+    """
+    return MappingProxyType({
+        "app.kubernetes.io/name": app_name,
+        "app.kubernetes.io/component": "web",
+    })
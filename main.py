@@ -0,0 +1,238 @@
+"""Kopf operator reconciling DjangoApp custom resources.
+
+For every DjangoApp the operator owns a Deployment, a HorizontalPodAutoscaler,
+a Service and an Ingress, built from the resource's spec.
+"""
+
+import asyncio
+import functools
+import json
+from dataclasses import dataclass
+
+import kopf
+from kubernetes_asyncio import client, config
+from kubernetes_asyncio.client import api_client, rest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from builders import DeploymentBuilder, HPABuilder, IngressBuilder, ServiceBuilder
+from builders._clone import clone
+from helpers import get_common_labels, get_pod_labels
+
+if orjson is not None:
+    class _OrjsonShim:
+        """Stand-in for the stdlib ``json`` calls inside the client.
+
+        orjson encodes the nested manifest dicts in native code; ``default``
+        turns the read-only label views (and any other mapping) into plain
+        dicts on the way out.
+        """
+
+        @staticmethod
+        def dumps(obj):
+            return orjson.dumps(obj, default=dict).decode()
+
+        @staticmethod
+        def loads(data):
+            return orjson.loads(data)
+
+    # Both modules resolve ``json`` as a module global, so swapping the
+    # reference reroutes request encoding and response decoding.
+    rest.json = _OrjsonShim
+    api_client.json = _OrjsonShim
+
+# Field manager identifying this operator for server-side apply.
+_FIELD_MANAGER = "djangoapp-operator"
+
+
+@kopf.on.startup()
+async def configure(**kwargs):
+    """Load the cluster configuration before any handler runs."""
+    try:
+        config.load_incluster_config()
+    except config.ConfigException:
+        await config.load_kube_config()
+
+
+# The ApiClient (and hence the connection pool) is built on first use, after
+# configure() has run, and shared by every handler invocation; the
+# per-resource API objects are stateless wrappers around it.
+
+@functools.cache
+def _api_client():
+    return client.ApiClient()
+
+
+@functools.cache
+def _apps():
+    return client.AppsV1Api(_api_client())
+
+
+@functools.cache
+def _autoscaling():
+    return client.AutoscalingV2Api(_api_client())
+
+
+@functools.cache
+def _core():
+    return client.CoreV1Api(_api_client())
+
+
+@functools.cache
+def _networking():
+    return client.NetworkingV1Api(_api_client())
+
+
+@dataclass(slots=True, frozen=True)
+class ManifestSet:
+    """The four child manifests built for one DjangoApp."""
+
+    deployment: dict
+    hpa: dict
+    service: dict
+    ingress: dict
+
+    def clones(self):
+        """Return a ManifestSet of fresh plain-dict clones.
+
+        clone() materializes the shared read-only label views, so the
+        copies are safe both for kopf.adopt's mutation and for the API
+        client's serialization.
+        """
+        return ManifestSet(clone(self.deployment), clone(self.hpa),
+                           clone(self.service), clone(self.ingress))
+
+
+# Last built ManifestSet per (namespace, name), keyed by the canonical JSON
+# of the spec that produced it.
+_BUILD_CACHE = {}
+
+
+def _build_all(spec, name, namespace):
+    """Build the child manifests for a DjangoApp as a ManifestSet.
+
+    Repeated events with an unchanged spec are served from _BUILD_CACHE and
+    skip validation and manifest construction entirely. Callers always get
+    fresh clones, because kopf.adopt mutates the bodies it is given.
+    """
+    digest = json.dumps(spec, sort_keys=True, default=dict)
+    key = (namespace, name)
+    cached = _BUILD_CACHE.get(key)
+    if cached is not None and cached[0] == digest:
+        manifests = cached[1]
+    else:
+        labels = get_common_labels(name)
+        pod_labels = get_pod_labels(name)
+        manifests = ManifestSet(
+            DeploymentBuilder(
+                name=name,
+                namespace=namespace,
+                image=spec["image"],
+                port=spec.get("port", 8000),
+                resources=spec.get("resources", {}),
+                labels=labels,
+                pod_labels=pod_labels,
+                min_replicas=spec.get("minReplicas", 1),
+                env=spec.get("env", []),
+            ).build(),
+            HPABuilder(
+                name=name,
+                namespace=namespace,
+                min_replicas=spec.get("minReplicas", 1),
+                max_replicas=spec.get("maxReplicas", 3),
+                target_cpu=spec.get("targetCPUUtilization", 80),
+                labels=labels,
+            ).build(),
+            ServiceBuilder(
+                name=name,
+                namespace=namespace,
+                port=spec.get("port", 8000),
+                labels=labels,
+                pod_labels=pod_labels,
+            ).build(),
+            IngressBuilder(
+                name=name,
+                namespace=namespace,
+                host=spec["host"],
+                labels=labels,
+            ).build(),
+        )
+        _BUILD_CACHE[key] = (digest, manifests)
+    return manifests.clones()
+
+
+@kopf.on.create("djangoapps")
+async def create_djangoapp(spec, name, namespace, **kwargs):
+    """Create the child resources for a new DjangoApp."""
+    dep_name = f"{name}-deployment"
+    hpa_name = f"{name}-hpa"
+    svc_name = f"{name}-service"
+    ing_name = f"{name}-ingress"
+
+    manifests = _build_all(spec, name, namespace)
+    deployment, hpa, service, ingress = (
+        manifests.deployment, manifests.hpa,
+        manifests.service, manifests.ingress)
+
+    kopf.adopt(deployment)
+    kopf.adopt(hpa)
+    kopf.adopt(service)
+    kopf.adopt(ingress)
+
+    # The four child resources are independent (owner references are set
+    # locally by kopf.adopt), so issue the API calls concurrently.
+    await asyncio.gather(
+        _apps().create_namespaced_deployment(namespace=namespace, body=deployment),
+        _autoscaling().create_namespaced_horizontal_pod_autoscaler(
+            namespace=namespace, body=hpa),
+        _core().create_namespaced_service(namespace=namespace, body=service),
+        _networking().create_namespaced_ingress(namespace=namespace, body=ingress),
+    )
+
+    return {"children": [dep_name, hpa_name, svc_name, ing_name]}
+
+
+@kopf.on.update("djangoapps")
+async def update_djangoapp(spec, name, namespace, **kwargs):
+    """Bring the child resources of an existing DjangoApp up to date."""
+    dep_name = f"{name}-deployment"
+    hpa_name = f"{name}-hpa"
+    svc_name = f"{name}-service"
+    ing_name = f"{name}-ingress"
+
+    manifests = _build_all(spec, name, namespace)
+    deployment, hpa, service, ingress = (
+        manifests.deployment, manifests.hpa,
+        manifests.service, manifests.ingress)
+
+    kopf.adopt(deployment)
+    kopf.adopt(hpa)
+    kopf.adopt(service)
+    kopf.adopt(ingress)
+
+    # As on create, the four patches have no ordering dependency. Use
+    # server-side apply so the API server only reconciles the fields this
+    # operator manages instead of re-admitting a full strategic-merge body.
+    await asyncio.gather(
+        _apps().patch_namespaced_deployment(
+            name=dep_name, namespace=namespace, body=deployment,
+            field_manager=_FIELD_MANAGER, force=True,
+            _content_type="application/apply-patch+yaml"),
+        _autoscaling().patch_namespaced_horizontal_pod_autoscaler(
+            name=hpa_name, namespace=namespace, body=hpa,
+            field_manager=_FIELD_MANAGER, force=True,
+            _content_type="application/apply-patch+yaml"),
+        _core().patch_namespaced_service(
+            name=svc_name, namespace=namespace, body=service,
+            field_manager=_FIELD_MANAGER, force=True,
+            _content_type="application/apply-patch+yaml"),
+        _networking().patch_namespaced_ingress(
+            name=ing_name, namespace=namespace, body=ingress,
+            field_manager=_FIELD_MANAGER, force=True,
+            _content_type="application/apply-patch+yaml"),
+    )
+
+    return {"children": [dep_name, hpa_name, svc_name, ing_name]}
@@ -0,0 +1,222 @@
+"""Tests for the manifest builders."""
+
+import asyncio
+
+import pytest
+import yaml
+from kubernetes_asyncio.client import ApiClient
+
+from builders import DeploymentBuilder, HPABuilder, IngressBuilder, ServiceBuilder
+from builders._clone import clone
+from builders.manifest import (dump_manifest, to_yaml, validate_all,
+                               validate_manifest)
+from builders.validation import (validate_cpu_target, validate_port,
+                                 validate_replica_bounds)
+
+
+@pytest.fixture(scope="session")
+def deployment_builder(app_name, namespace, image, port, resources, labels,
+                       pod_labels, env):
+    return DeploymentBuilder(
+        name=app_name,
+        namespace=namespace,
+        image=image,
+        port=port,
+        resources=resources,
+        labels=labels,
+        pod_labels=pod_labels,
+        min_replicas=2,
+        env=env,
+    )
+
+
+@pytest.fixture(scope="session")
+def hpa_builder(app_name, namespace, labels):
+    return HPABuilder(
+        name=app_name,
+        namespace=namespace,
+        min_replicas=2,
+        max_replicas=5,
+        target_cpu=75,
+        labels=labels,
+    )
+
+
+@pytest.fixture(scope="session")
+def service_builder(app_name, namespace, port, labels, pod_labels):
+    return ServiceBuilder(
+        name=app_name,
+        namespace=namespace,
+        port=port,
+        labels=labels,
+        pod_labels=pod_labels,
+    )
+
+
+@pytest.fixture(scope="session")
+def ingress_builder(app_name, namespace, labels):
+    return IngressBuilder(
+        name=app_name,
+        namespace=namespace,
+        host="test-app.example.com",
+        labels=labels,
+    )
+
+
+@pytest.mark.parametrize("builder_fixture,expected_kind,name_suffix", [
+    ("deployment_builder", "Deployment", "-deployment"),
+    ("hpa_builder", "HorizontalPodAutoscaler", "-hpa"),
+    ("service_builder", "Service", "-service"),
+    ("ingress_builder", "Ingress", "-ingress"),
+])
+def test_builder_emits_kind_name_and_labels(request, builder_fixture,
+                                            expected_kind, name_suffix,
+                                            app_name, namespace, labels):
+    builder = request.getfixturevalue(builder_fixture)
+    manifest = validate_manifest(builder.build())
+    assert manifest["kind"] == expected_kind
+    assert manifest["metadata"]["name"] == app_name + name_suffix
+    assert manifest["metadata"]["namespace"] == namespace
+    assert manifest["metadata"]["labels"] == dict(labels)
+
+
+def test_deployment_builder(deployment_builder, image, port, pod_labels,
+                            resources, env):
+    deployment = validate_manifest(deployment_builder.build())
+    assert deployment["spec"]["replicas"] == 2
+    assert deployment["spec"]["selector"]["matchLabels"] == dict(pod_labels)
+    container = deployment["spec"]["template"]["spec"]["containers"][0]
+    assert container["image"] == image
+    assert container["ports"][0]["containerPort"] == port
+    assert container["env"] == list(env)
+    assert container["resources"] is resources
+
+
+def test_hpa_builder(hpa_builder):
+    hpa = validate_manifest(hpa_builder.build())
+    assert hpa["spec"]["minReplicas"] == 2
+    assert hpa["spec"]["maxReplicas"] == 5
+    assert hpa["spec"]["scaleTargetRef"]["name"] == "test-app-deployment"
+    target = hpa["spec"]["metrics"][0]["resource"]["target"]
+    assert target["averageUtilization"] == 75
+
+
+def test_service_builder(service_builder, port, pod_labels):
+    service = validate_manifest(service_builder.build())
+    assert service["spec"]["selector"] == dict(pod_labels)
+    assert service["spec"]["ports"][0]["targetPort"] == port
+
+
+def test_ingress_builder(ingress_builder):
+    ingress = validate_manifest(ingress_builder.build())
+    rule = ingress["spec"]["rules"][0]
+    assert rule["host"] == "test-app.example.com"
+    backend = rule["http"]["paths"][0]["backend"]["service"]
+    assert backend["name"] == "test-app-service"
+
+
+def test_validate_all(deployment_builder, hpa_builder, service_builder,
+                      ingress_builder):
+    manifests = [builder.build() for builder in (
+        deployment_builder, hpa_builder, service_builder, ingress_builder)]
+    assert validate_all(manifests) is manifests
+    with pytest.raises(ValueError, match=r"Service.*Ingress"):
+        validate_all([{"kind": "Service"}, {"kind": "Ingress"}])
+
+
+def test_cloned_bodies_survive_client_sanitization(deployment_builder, labels):
+    # sanitize_for_serialization runs on every request body and treats any
+    # non-dict mapping as an OpenAPI model, so the read-only label views
+    # must not survive the clone that precedes an API call.
+    body = clone(deployment_builder.build())
+
+    async def sanitize():
+        async with ApiClient() as api:
+            return api.sanitize_for_serialization(body)
+
+    sanitized = asyncio.run(sanitize())
+    assert sanitized["metadata"]["labels"] == dict(labels)
+    container = sanitized["spec"]["template"]["spec"]["containers"][0]
+    assert type(container["resources"]) is dict
+    assert all(type(item) is dict for item in container["env"])
+
+
+def test_dump_manifest_is_deterministic(deployment_builder):
+    first = dump_manifest(deployment_builder.build())
+    second = dump_manifest(deployment_builder.build())
+    assert isinstance(first, bytes)
+    assert first == second
+
+
+def test_to_yaml_round_trips(deployment_builder, labels):
+    loaded = yaml.safe_load(to_yaml(deployment_builder.build()))
+    assert loaded["kind"] == "Deployment"
+    assert loaded["metadata"]["name"] == "test-app-deployment"
+    assert loaded["metadata"]["labels"] == dict(labels)
+
+
+@pytest.mark.parametrize("bad_port", [0, -1, 65536, 99999, "80", True])
+def test_port_validation_rejects(bad_port):
+    with pytest.raises(ValueError, match=r"port"):
+        validate_port(bad_port)
+
+
+@pytest.mark.parametrize("good_port", [1, 80, 8000, 65535])
+def test_port_validation_accepts(good_port):
+    validate_port(good_port)
+
+
+@pytest.mark.parametrize("min_replicas,max_replicas", [
+    (0, 3), (-1, 3), (5, 2), (1, 0), ("1", 3), (1, "3"),
+])
+def test_replica_bounds_validation_rejects(min_replicas, max_replicas):
+    with pytest.raises(ValueError, match=r"replicas"):
+        validate_replica_bounds(min_replicas, max_replicas)
+
+
+def test_replica_bounds_validation_rejects_bool_after_cached_int():
+    # True == 1, so a cached success for (1, 3) must not leak to (True, 3).
+    validate_replica_bounds(1, 3)
+    with pytest.raises(ValueError, match=r"min_replicas"):
+        validate_replica_bounds(True, 3)
+
+
+@pytest.mark.parametrize("bad_target", [0, -5, 101, "50"])
+def test_cpu_target_validation_rejects(bad_target):
+    with pytest.raises(ValueError, match=r"target_cpu"):
+        validate_cpu_target(bad_target)
+
+
+def test_builders_surface_validation_errors(app_name, namespace, image,
+                                            labels, pod_labels):
+    with pytest.raises(ValueError, match=r"port"):
+        DeploymentBuilder(
+            name=app_name,
+            namespace=namespace,
+            image=image,
+            port=99999,
+            resources={},
+            labels=labels,
+            pod_labels=pod_labels,
+        )
+    with pytest.raises(ValueError, match=r"min_replicas"):
+        HPABuilder(
+            name=app_name,
+            namespace=namespace,
+            min_replicas=5,
+            max_replicas=2,
+            target_cpu=75,
+            labels=labels,
+        )
+
+
+@pytest.mark.parametrize("field,value", [
+    ("resources", None), ("env", 5), ("labels", 7),
+])
+def test_deployment_builder_rejects_wrong_types_with_value_error(
+        app_name, namespace, image, port, labels, pod_labels, field, value):
+    kwargs = dict(name=app_name, namespace=namespace, image=image, port=port,
+                  resources={}, labels=labels, pod_labels=pod_labels)
+    kwargs[field] = value
+    with pytest.raises(ValueError, match=field):
+        DeploymentBuilder(**kwargs)